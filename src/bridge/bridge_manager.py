@@ -2,6 +2,7 @@
 JSPyBridge Manager - Handles Python to JavaScript communication with Mineflayer
 """
 import asyncio
+import itertools
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -52,6 +53,8 @@ class BridgeManager:
         self.bot = None
         self.event_handlers = {}
         self.command_queue = asyncio.PriorityQueue(maxsize=self.config.event_queue_size)
+        # Monotonic tiebreaker so equal-priority commands stay FIFO without comparing Command objects
+        self._command_seq = itertools.count()
         self.pending_commands = {}
         self.is_connected = False
         self.is_spawned = False
@@ -264,7 +267,7 @@ class BridgeManager:
             callback=lambda result: future.set_result(result),
         )
 
-        await self.command_queue.put((-command.priority, command))
+        await self.command_queue.put((-command.priority, next(self._command_seq), command))
 
         try:
             # Store command for potential cleanup
@@ -285,18 +288,17 @@ class BridgeManager:
 
         while True:
             try:
-                while len(batch) < self.config.batch_size:
-                    try:
-                        _, command = await asyncio.wait_for(self.command_queue.get(), timeout=0.1)
-                        batch.append(command)
-                    except asyncio.TimeoutError:
-                        break
-
-                if batch:
-                    await self._execute_batch(batch)
-                    batch = []
-
-                await asyncio.sleep(0.01)
+                # Block until a command arrives instead of polling with a timeout
+                _, _, command = await self.command_queue.get()
+                batch.append(command)
+
+                # Drain whatever else is already queued without awaiting per command
+                while len(batch) < self.config.batch_size and not self.command_queue.empty():
+                    _, _, command = self.command_queue.get_nowait()
+                    batch.append(command)
+
+                await self._execute_batch(batch)
+                batch = []
 
             except Exception as e:
                 logger.error("Error in command processor", error=str(e))
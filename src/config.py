@@ -2,6 +2,7 @@
 Configuration management for Minecraft Multi-Agent system
 """
 
+import functools
 import os
 from typing import Optional
 
@@ -53,10 +54,12 @@ class AgentConfig(BaseSettings):
         env_prefix = "MINECRAFT_AGENT_"
         case_sensitive = False
         extra = "ignore"  # Ignore extra environment variables
+        frozen = True  # Instances are shared through get_config
 
 
+@functools.lru_cache(maxsize=None)
 def get_config() -> AgentConfig:
-    """Get the configuration instance"""
+    """Get the configuration instance, loaded from the environment and .env on first use"""
     return AgentConfig()
 
 
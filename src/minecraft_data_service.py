@@ -1,7 +1,10 @@
 """
 Minecraft Data Service - Centralized Python service for all Minecraft data lookups
 """
+import functools
 import logging
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 import minecraft_data
@@ -12,14 +15,13 @@ logger = logging.getLogger(__name__)
 class MinecraftDataService:
     """Service for handling all Minecraft data lookups using python-minecraft-data"""
 
-    _instance = None
-    _version = None
+    # One instance per Minecraft version, so switching versions doesn't reload data already loaded
+    _instances: Dict[str, "MinecraftDataService"] = {}
 
     def __new__(cls, mc_version: str = "1.21.1"):
-        if cls._instance is None or cls._version != mc_version:
-            cls._instance = super().__new__(cls)
-            cls._version = mc_version
-        return cls._instance
+        if mc_version not in cls._instances:
+            cls._instances[mc_version] = super().__new__(cls)
+        return cls._instances[mc_version]
 
     def __init__(self, mc_version: str = "1.21.1"):
         """Initialize the MinecraftDataService with specified Minecraft version
@@ -27,12 +29,20 @@ class MinecraftDataService:
         Args:
             mc_version: Minecraft version string (e.g., "1.21.1")
         """
-        # Only initialize if not already initialized or version changed
-        if not hasattr(self, "mc_data") or self.version != mc_version:
+        # Only initialize if this version's instance hasn't finished loading its data yet
+        if not getattr(self, "_initialized", False):
             try:
                 # Initialize minecraft_data as shown in example.py
                 self.mc_data = minecraft_data(mc_version)
                 self.version = mc_version
+                self._fuzzy_candidates = self._build_fuzzy_candidates()
+                self._fuzzy_exact = self._build_fuzzy_exact()
+                self._build_block_indexes()
+                self._item_aliases = self._build_item_aliases()
+                self._recipes_by_item_name = self._build_recipes_by_item_name()
+                self._inventory_craftable = self._build_inventory_craftable()
+                # Set last, so an instance whose index build raised is rebuilt on the next construction
+                self._initialized = True
                 logger.info(f"Initialized MinecraftDataService for version {mc_version}")
             except Exception as e:
                 logger.error(f"Failed to initialize minecraft-data for version {mc_version}: {e}")
@@ -64,10 +74,8 @@ class MinecraftDataService:
             Block data dict or None if not found
         """
         try:
-            # Use blocks_list for ID lookup
-            if 0 <= block_id < len(self.mc_data.blocks_list):
-                return self.mc_data.blocks_list[block_id]
-            return None
+            # blocks is keyed by ID, so this doesn't rely on list position matching the ID
+            return self.mc_data.blocks.get(block_id)
         except Exception as e:
             logger.error(f"Error getting block by id {block_id}: {e}")
             return None
@@ -107,10 +115,8 @@ class MinecraftDataService:
             Item data dict or None if not found
         """
         try:
-            # Use items_list for ID lookup
-            if 0 <= item_id < len(self.mc_data.items_list):
-                return self.mc_data.items_list[item_id]
-            return None
+            # items is keyed by ID, so this doesn't rely on list position matching the ID
+            return self.mc_data.items.get(item_id)
         except Exception as e:
             logger.error(f"Error getting item by id {item_id}: {e}")
             return None
@@ -130,9 +136,7 @@ class MinecraftDataService:
             # Filter by name pattern if provided
             if "name_pattern" in options:
                 pattern = options["name_pattern"].lower()
-                for name, block_data in self.mc_data.blocks_name.items():
-                    if pattern in name.lower():
-                        results.append(block_data)
+                results = [block_data for name, block_data in self._block_names_lower if pattern in name]
 
             # Filter by hardness range if provided
             if "min_hardness" in options or "max_hardness" in options:
@@ -143,16 +147,35 @@ class MinecraftDataService:
                 if results:
                     results = [b for b in results if min_h <= (b.get("hardness", 0)) <= max_h]
                 else:
-                    # Otherwise search all blocks
-                    for block_data in self.mc_data.blocks_name.values():
-                        if min_h <= (block_data.get("hardness", 0)) <= max_h:
-                            results.append(block_data)
+                    # Otherwise range-search the hardness index, then restore data order
+                    lo = bisect_left(self._hardness_keys, min_h)
+                    hi = bisect_right(self._hardness_keys, max_h)
+                    results = [
+                        block_data for _, block_data in sorted(self._blocks_by_hardness[lo:hi], key=itemgetter(0))
+                    ]
 
             return results
         except Exception as e:
             logger.error(f"Error finding blocks with options {options}: {e}")
             return []
 
+    def _build_block_indexes(self) -> None:
+        """Precompute the lookup structures used by find_blocks"""
+        # Lowercased names, so name filters don't lowercase every block per query
+        self._block_names_lower = [(name.lower(), block_data) for name, block_data in self.mc_data.blocks_name.items()]
+
+        # Blocks sorted by hardness (with their original position) for range queries
+        by_hardness = sorted(
+            (
+                (block_data.get("hardness", 0), position, block_data)
+                for position, block_data in enumerate(self.mc_data.blocks_name.values())
+                if block_data.get("hardness", 0) is not None
+            ),
+            key=itemgetter(0, 1),
+        )
+        self._hardness_keys = [hardness for hardness, _, _ in by_hardness]
+        self._blocks_by_hardness = [(position, block_data) for _, position, block_data in by_hardness]
+
     def get_recipes_for_item_id(self, item_id: int) -> List[Dict[str, Any]]:
         """Get all recipes that produce the specified item
 
@@ -178,11 +201,25 @@ class MinecraftDataService:
         Returns:
             List of recipe dicts
         """
+        recipes = self._recipes_by_item_name.get(item_name)
+        if recipes is not None:
+            return recipes
+
         item = self.get_item_by_name(item_name)
         if not item:
             return []
         return self.get_recipes_for_item_id(item["id"])
 
+    def _build_recipes_by_item_name(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Precompute the name to recipes join used by get_recipes_for_item_name
+
+        Returns:
+            Dict mapping every item/block name to its recipe list (empty if uncraftable)
+        """
+        # Item names shadow block names, matching get_item_by_name's lookup order
+        names = {**self.mc_data.blocks_name, **self.mc_data.items_name}
+        return {name: self.get_recipes_for_item_id(item["id"]) for name, item in names.items()}
+
     def get_food_points(self, item_name: str) -> int:
         """Get food points for a food item
 
@@ -249,27 +286,31 @@ class MinecraftDataService:
         Returns:
             True if crafting table required, False if can craft in inventory
         """
-        # Get recipes for this item
-        recipes = self.get_recipes_for_item_name(item_name)
+        # Items without recipes are absent too, so they default to needing a crafting table
+        return item_name not in self._inventory_craftable
 
-        if not recipes:
-            # No recipe found, assume it needs crafting table if craftable
-            return True
+    def _build_inventory_craftable(self) -> frozenset:
+        """Precompute the items needs_crafting_table treats as craftable in inventory
 
-        # Check if any recipe can fit in 2x2 grid
-        for recipe in recipes:
-            if "inShape" in recipe:
-                # Shaped recipe - check dimensions
-                shape = recipe["inShape"]
-                if len(shape) <= 2 and all(len(row) <= 2 for row in shape):
-                    return False  # Can craft in inventory
-            elif "ingredients" in recipe:
-                # Shapeless recipe - check ingredient count
-                if len(recipe["ingredients"]) <= 4:
-                    return False  # Can craft in inventory
-
-        # Default to needing crafting table
-        return True
+        Returns:
+            Frozenset of names of items with at least one recipe that fits the 2x2 grid
+        """
+        craftable = set()
+        for name, recipes in self._recipes_by_item_name.items():
+            # Check if any recipe can fit in 2x2 grid
+            for recipe in recipes:
+                if "inShape" in recipe:
+                    # Shaped recipe - check dimensions
+                    shape = recipe["inShape"]
+                    if len(shape) <= 2 and all(len(row) <= 2 for row in shape):
+                        craftable.add(name)
+                        break
+                elif "ingredients" in recipe:
+                    # Shapeless recipe - check ingredient count
+                    if len(recipe["ingredients"]) <= 4:
+                        craftable.add(name)
+                        break
+        return frozenset(craftable)
 
     def normalize_item_name(self, item_name: str) -> str:
         """Normalize item names using generic fuzzy matching
@@ -283,16 +324,10 @@ class MinecraftDataService:
         # Basic normalization: lowercase and remove extra spaces
         normalized = item_name.lower().strip()
 
-        # Remove common plural suffixes generically
-        if normalized.endswith("s") and len(normalized) > 2:
-            singular = normalized[:-1]
-            # Check if singular form exists
-            if self.get_item_by_name(singular):
-                return singular
-
-        # Try exact match first
-        if self.get_item_by_name(normalized):
-            return normalized
+        # Known names and their plurals resolve through the precomputed alias table
+        alias = self._item_aliases.get(normalized)
+        if alias:
+            return alias
 
         # Fuzzy match against all items
         best_match = self.fuzzy_match_item_name(normalized)
@@ -301,6 +336,19 @@ class MinecraftDataService:
 
         return item_name
 
+    def _build_item_aliases(self) -> Dict[str, str]:
+        """Precompute the name lookups used by normalize_item_name
+
+        Returns:
+            Dict mapping every item/block name and its "s" plural to the canonical name
+        """
+        names = list(self.mc_data.items_name) + list(self.mc_data.blocks_name)
+        aliases = {name: name for name in names}
+        # A singular match takes precedence over an exact match of the plural form
+        for name in names:
+            aliases[name + "s"] = name
+        return aliases
+
     def fuzzy_match_item_name(self, query: str, threshold: float = 0.6) -> Optional[str]:
         """Find best matching item name using fuzzy string matching
 
@@ -312,24 +360,31 @@ class MinecraftDataService:
             Best matching item name or None
         """
         try:
-            all_items = self.get_all_items()
             best_match = None
             best_score = 0
 
             query_lower = query.lower()
-            query_words = set(query_lower.split())
 
-            for item in all_items:
-                item_name = item["name"].lower()
-                item_words = set(item_name.replace("_", " ").split())
+            # Exact match
+            exact = self._fuzzy_exact.get(query_lower)
+            if exact is not None:
+                return exact
+
+            query_split = query_lower.split()
+            if not query_split:
+                return None
+            query_words = set(query_split)
+            query_last_word = query_split[-1]
 
+            # Character counts of the query, used for the typo check below
+            query_chars = {}
+            for c in query_lower:
+                query_chars[c] = query_chars.get(c, 0) + 1
+
+            for name, item_name, item_words, item_chars, item_suffix in self._fuzzy_candidates:
                 # Calculate similarity score
                 score = 0
 
-                # Exact match
-                if query_lower == item_name:
-                    return item["name"]
-
                 # Substring match
                 if query_lower in item_name:
                     score += 0.8
@@ -343,21 +398,11 @@ class MinecraftDataService:
 
                 # Character similarity (enhanced for typos)
                 # Check character-by-character similarity
-                common_chars = 0
-                for i, char in enumerate(query_lower[: min(len(query_lower), len(item_name))]):
-                    if i < len(item_name) and char == item_name[i]:
-                        common_chars += 1
+                common_chars = sum(map(str.__eq__, query_lower, item_name))
 
                 # Check for character transpositions and typos
                 if abs(len(query_lower) - len(item_name)) <= 2:  # Similar length
                     # Count matching characters regardless of position
-                    query_chars = {}
-                    item_chars = {}
-                    for c in query_lower:
-                        query_chars[c] = query_chars.get(c, 0) + 1
-                    for c in item_name:
-                        item_chars[c] = item_chars.get(c, 0) + 1
-
                     matching_chars = 0
                     for c, count in query_chars.items():
                         matching_chars += min(count, item_chars.get(c, 0))
@@ -370,12 +415,12 @@ class MinecraftDataService:
                     score += (common_chars / len(query_lower)) * 0.4
 
                 # Bonus for matching important suffixes/prefixes
-                if query_lower.endswith(item_name.split("_")[-1]) or item_name.endswith(query_lower.split()[-1]):
+                if query_lower.endswith(item_suffix) or item_name.endswith(query_last_word):
                     score += 0.2
 
                 if score > best_score and score >= threshold:
                     best_score = score
-                    best_match = item["name"]
+                    best_match = name
 
             return best_match
 
@@ -383,6 +428,40 @@ class MinecraftDataService:
             logger.error(f"Error in fuzzy matching: {e}")
             return None
 
+    def _build_fuzzy_candidates(self) -> List[tuple]:
+        """Precompute the per-item features used by fuzzy_match_item_name
+
+        Returns:
+            List of (name, lowercase name, word set, character counts, last "_" segment) tuples
+        """
+        candidates = []
+        for item in self.get_all_items():
+            item_name = item["name"].lower()
+            item_chars = {}
+            for c in item_name:
+                item_chars[c] = item_chars.get(c, 0) + 1
+            candidates.append(
+                (
+                    item["name"],
+                    item_name,
+                    set(item_name.replace("_", " ").split()),
+                    item_chars,
+                    item_name.split("_")[-1],
+                )
+            )
+        return candidates
+
+    def _build_fuzzy_exact(self) -> Dict[str, str]:
+        """Precompute the exact-match lookup used by fuzzy_match_item_name
+
+        Returns:
+            Dict mapping each lowercase item name to the first item name it came from
+        """
+        exact = {}
+        for name, item_name, *_ in self._fuzzy_candidates:
+            exact.setdefault(item_name, name)
+        return exact
+
     def get_material_for_tool(self, tool_name: str) -> Optional[str]:
         """Get the material type for a tool
 
@@ -529,6 +608,16 @@ class MinecraftDataService:
         Returns:
             Best recipe dict or None if no craftable recipe found
         """
+        # Scoring only depends on the item and inventory contents, so memoize on an inventory snapshot
+        return self._select_best_recipe_cached(item_name, frozenset(inventory.items()))
+
+    @functools.lru_cache(maxsize=1024)
+    def _select_best_recipe_cached(self, item_name: str, inventory_items: frozenset) -> Optional[Dict[str, Any]]:
+        """Memoized select_best_recipe keyed by a hashable inventory snapshot"""
+        return self._select_best_recipe(item_name, dict(inventory_items))
+
+    def _select_best_recipe(self, item_name: str, inventory: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """Score every recipe for item_name against inventory and return the best craftable one"""
         recipes = self.get_recipes_for_item_name(item_name)
 
         if not recipes:
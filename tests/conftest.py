@@ -0,0 +1,10 @@
+"""Shared pytest fixtures"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mc_service():
+    """MinecraftDataService for 1.21.1, loaded once per test session"""
+    from src.minecraft_data_service import MinecraftDataService
+
+    return MinecraftDataService("1.21.1")
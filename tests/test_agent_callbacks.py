@@ -1,5 +1,8 @@
 """Test suite for enhanced agent communication callbacks."""
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+from structlog.stdlib import BoundLogger
 
 from minecraft_coordinator.callbacks import (
     get_configured_callbacks,
@@ -9,24 +12,32 @@ from minecraft_coordinator.callbacks import (
 )
 
 
+@pytest.fixture
+def mock_logger():
+    """Agent logger the callbacks should write to."""
+    # Agents carry structlog loggers (configured with the stdlib BoundLogger), which take event kwargs
+    return create_autospec(BoundLogger, instance=True)
+
+
+def make_context(agent_name, agent_logger):
+    """Build a callback/tool context mock whose invocation agent carries agent_logger."""
+    context = Mock()
+    context.agent_name = agent_name
+
+    # Mock invocation context and agent
+    invocation_context = Mock()
+    invocation_context.agent = Mock(_logger=agent_logger)
+    context._invocation_context = invocation_context
+    return context
+
+
 class TestAgentThoughtsCallback:
     """Test the agent thoughts logging callback."""
 
-    def test_should_log_agent_thoughts_when_agent_responds(self):
+    def test_should_log_agent_thoughts_when_agent_responds(self, mock_logger):
         """Agent thoughts should be captured from LLM responses."""
         # Arrange
-        mock_logger = Mock()
-
-        # Create callback context mock
-        callback_context = Mock()
-        callback_context.agent_name = "CoordinatorAgent"
-
-        # Mock invocation context and agent
-        invocation_context = Mock()
-        agent = Mock()
-        agent._logger = mock_logger
-        invocation_context.agent = agent
-        callback_context._invocation_context = invocation_context
+        callback_context = make_context("CoordinatorAgent", mock_logger)
 
         # Mock LLM response
         llm_response = Mock()
@@ -44,21 +55,10 @@ class TestAgentThoughtsCallback:
         assert "I need to gather oak logs first, then craft planks." in call_args[1]["thought"]
         assert "timestamp" in call_args[1]
 
-    def test_should_log_tool_calls_when_agent_uses_tools(self):
+    def test_should_log_tool_calls_when_agent_uses_tools(self, mock_logger):
         """Tool calls should be logged from LLM response."""
         # Arrange
-        mock_logger = Mock()
-
-        # Create callback context mock
-        callback_context = Mock()
-        callback_context.agent_name = "GathererAgent"
-
-        # Mock invocation context and agent
-        invocation_context = Mock()
-        agent = Mock()
-        agent._logger = mock_logger
-        invocation_context.agent = agent
-        callback_context._invocation_context = invocation_context
+        callback_context = make_context("GathererAgent", mock_logger)
 
         # Mock function call
         function_call = Mock()
@@ -81,21 +81,10 @@ class TestAgentThoughtsCallback:
         assert call_args[1]["tool"] == "find_nearest_blocks"
         assert call_args[1]["args"] == {"block_type": "oak_log", "count": 5}
 
-    def test_should_log_agent_delegation(self):
+    def test_should_log_agent_delegation(self, mock_logger):
         """Agent delegations should be logged."""
         # Arrange
-        mock_logger = Mock()
-
-        # Create callback context mock
-        callback_context = Mock()
-        callback_context.agent_name = "CoordinatorAgent"
-
-        # Mock invocation context and agent
-        invocation_context = Mock()
-        agent = Mock()
-        agent._logger = mock_logger
-        invocation_context.agent = agent
-        callback_context._invocation_context = invocation_context
+        callback_context = make_context("CoordinatorAgent", mock_logger)
 
         # Mock function call for agent delegation
         function_call = Mock()
@@ -130,21 +119,10 @@ class TestAgentThoughtsCallback:
 class TestToolInvocationCallbacks:
     """Test tool invocation start/end callbacks."""
 
-    def test_should_log_tool_start_with_context(self):
+    def test_should_log_tool_start_with_context(self, mock_logger):
         """Tool invocation start should log context."""
         # Arrange
-        mock_logger = Mock()
-
-        # Create tool context mock
-        tool_context = Mock()
-        tool_context.agent_name = "CrafterAgent"
-
-        # Mock invocation context and agent
-        invocation_context = Mock()
-        agent = Mock()
-        agent._logger = mock_logger
-        invocation_context.agent = agent
-        tool_context._invocation_context = invocation_context
+        tool_context = make_context("CrafterAgent", mock_logger)
 
         # Mock state
         state = Mock()
@@ -171,23 +149,12 @@ class TestToolInvocationCallbacks:
         assert call_args[1]["state_snapshot"]["minecraft.inventory"] == {"oak_log": 1}
         assert tool_context._start_time == 1000.0
 
-    def test_should_log_tool_end_with_duration(self):
+    def test_should_log_tool_end_with_duration(self, mock_logger):
         """Tool invocation end should log result and duration."""
         # Arrange
-        mock_logger = Mock()
-
-        # Create tool context mock
-        tool_context = Mock()
-        tool_context.agent_name = "CrafterAgent"
+        tool_context = make_context("CrafterAgent", mock_logger)
         tool_context._start_time = 1000.0
 
-        # Mock invocation context and agent
-        invocation_context = Mock()
-        agent = Mock()
-        agent._logger = mock_logger
-        invocation_context.agent = agent
-        tool_context._invocation_context = invocation_context
-
         # Mock state
         state = Mock()
         state.get = Mock(side_effect=lambda key: {"oak_planks": 4} if key == "minecraft.inventory" else None)
@@ -0,0 +1,83 @@
+"""Test BridgeManager command queue processing"""
+import asyncio
+
+import pytest
+
+from src.bridge.bridge_manager import BridgeConfig, BridgeManager
+
+
+class TestCommandQueue:
+    """Test how queued commands are batched and dispatched"""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a connected bridge whose command execution is stubbed out"""
+        bridge = BridgeManager(config=BridgeConfig(batch_size=3), auto_start=False)
+        bridge.is_connected = True
+        bridge.is_spawned = True
+
+        bridge.executed = []
+        bridge.batches = []
+
+        async def execute_single_command(command):
+            bridge.executed.append(command.method)
+            return command.method
+
+        execute_batch = bridge._execute_batch
+
+        async def record_batch(commands):
+            bridge.batches.append([command.method for command in commands])
+            await execute_batch(commands)
+
+        bridge._execute_single_command = execute_single_command
+        bridge._execute_batch = record_batch
+        return bridge
+
+    @staticmethod
+    async def enqueue(bridge, methods):
+        """Queue one command per method and let each reach the queue before returning"""
+        tasks = [asyncio.create_task(bridge.execute_command(method)) for method in methods]
+        await asyncio.sleep(0)
+        assert bridge.command_queue.qsize() == len(methods)
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_should_run_lone_command_without_delay(self, bridge):
+        """A single command should run as soon as it is queued, without a batching window"""
+        processor = asyncio.create_task(bridge._process_command_queue())
+        try:
+            # The old processor waited up to 0.1s for more commands before running a batch
+            result = await asyncio.wait_for(bridge.execute_command("entity.position"), timeout=0.05)
+        finally:
+            processor.cancel()
+
+        assert result == "entity.position"
+        assert bridge.batches == [["entity.position"]]
+
+    @pytest.mark.asyncio
+    async def test_should_drain_queued_commands_up_to_batch_size(self, bridge):
+        """Commands already queued should be drained into batches of at most batch_size"""
+        tasks = await self.enqueue(bridge, ["a", "b", "c", "d", "e"])
+
+        processor = asyncio.create_task(bridge._process_command_queue())
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        finally:
+            processor.cancel()
+
+        assert results == ["a", "b", "c", "d", "e"]
+        assert bridge.batches == [["a", "b", "c"], ["d", "e"]]
+
+    @pytest.mark.asyncio
+    async def test_should_run_equal_priority_commands_in_fifo_order(self, bridge):
+        """Commands with the same priority should run in the order they were queued"""
+        methods = [f"cmd_{i}" for i in range(7)]
+        tasks = await self.enqueue(bridge, methods)
+
+        processor = asyncio.create_task(bridge._process_command_queue())
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        finally:
+            processor.cancel()
+
+        assert bridge.executed == methods
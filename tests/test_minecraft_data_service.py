@@ -1,241 +1,254 @@
 #!/usr/bin/env python3
 """Test MinecraftDataService functionality"""
+import logging
 import os
 import sys
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.minecraft_data_service import MinecraftDataService
 
+log = logging.getLogger(__name__)
 
-def test_basic_lookups():
-    """Test basic item and block lookups"""
-    service = MinecraftDataService("1.21.1")
 
-    print("=== Testing basic lookups ===")
+def test_basic_lookups(mc_service):
+    """Test basic item and block lookups"""
+    log.debug("=== Testing basic lookups ===")
 
     # Test block lookup
-    stone = service.get_block_by_name("stone")
+    stone = mc_service.get_block_by_name("stone")
     assert stone is not None, "Stone block should exist"
     assert stone["name"] == "stone", "Stone block name should match"
     assert stone["id"] == 1, "Stone block ID should be 1"
-    print(f"✓ Stone block: ID={stone['id']}, hardness={stone.get('hardness', 'N/A')}")
+    log.debug(f"✓ Stone block: ID={stone['id']}, hardness={stone.get('hardness', 'N/A')}")
 
     # Test item lookup
-    stick = service.get_item_by_name("stick")
+    stick = mc_service.get_item_by_name("stick")
     assert stick is not None, "Stick item should exist"
     assert stick["name"] == "stick", "Stick item name should match"
-    print(f"✓ Stick item: ID={stick['id']}, stackSize={stick.get('stackSize', 64)}")
+    log.debug(f"✓ Stick item: ID={stick['id']}, stackSize={stick.get('stackSize', 64)}")
 
     # Test non-existent item
-    fake_item = service.get_item_by_name("fake_item_that_does_not_exist")
+    fake_item = mc_service.get_item_by_name("fake_item_that_does_not_exist")
     assert fake_item is None, "Non-existent item should return None"
-    print("✓ Non-existent item returns None")
+    log.debug("✓ Non-existent item returns None")
 
 
-def test_recipes():
-    """Test recipe lookups"""
+def test_instance_cached_per_version(mc_service):
+    """Test that constructing the service again reuses the loaded instance"""
+    log.debug("=== Testing instance caching ===")
+
+    assert MinecraftDataService("1.21.1") is mc_service, "Same version should return the cached instance"
+    assert MinecraftDataService("1.21.1").mc_data is mc_service.mc_data, "Data should not be reloaded"
+    log.debug("✓ Service instance is cached per version")
+
+
+def test_failed_initialization_is_retried(monkeypatch):
+    """Test that an instance whose initialization raised is rebuilt on the next construction"""
+    log.debug("=== Testing initialization retry ===")
+
+    # Use a fresh instance cache so the session-wide service is left untouched
+    monkeypatch.setattr(MinecraftDataService, "_instances", {})
+    build_block_indexes = MinecraftDataService._build_block_indexes
+    calls = []
+
+    def fail_once(self):
+        calls.append(self)
+        if len(calls) == 1:
+            raise RuntimeError("index build failed")
+        build_block_indexes(self)
+
+    monkeypatch.setattr(MinecraftDataService, "_build_block_indexes", fail_once)
+
+    with pytest.raises(RuntimeError):
+        MinecraftDataService("1.21.1")
+
     service = MinecraftDataService("1.21.1")
+    assert len(calls) == 2, "Initialization should run again after a failure"
+    assert service.find_blocks({"name_pattern": "log"}), "Block indexes should be built on retry"
+    assert service.needs_crafting_table("wooden_pickaxe"), "Later indexes should be built on retry"
+    log.debug("✓ Failed initialization is retried")
+
 
-    print("\n=== Testing recipes ===")
+def test_recipes(mc_service):
+    """Test recipe lookups"""
+    log.debug("=== Testing recipes ===")
 
     # Test stick recipes
-    stick_recipes = service.get_recipes_for_item_name("stick")
+    stick_recipes = mc_service.get_recipes_for_item_name("stick")
     assert len(stick_recipes) > 0, "Stick should have recipes"
-    print(f"✓ Stick has {len(stick_recipes)} recipes")
+    log.debug(f"✓ Stick has {len(stick_recipes)} recipes")
 
     # Check first recipe structure
     first_recipe = stick_recipes[0]
     assert "result" in first_recipe, "Recipe should have result"
     assert first_recipe["result"]["count"] > 0, "Recipe should produce items"
-    print(f"✓ First recipe produces {first_recipe['result']['count']} sticks")
+    log.debug(f"✓ First recipe produces {first_recipe['result']['count']} sticks")
 
     # Test item with no recipes
-    stone_recipes = service.get_recipes_for_item_name("bedrock")
+    stone_recipes = mc_service.get_recipes_for_item_name("bedrock")
     assert len(stone_recipes) == 0, "Bedrock should have no recipes"
-    print("✓ Bedrock has no recipes (as expected)")
+    log.debug("✓ Bedrock has no recipes (as expected)")
 
 
-def test_food_data():
+def test_food_data(mc_service):
     """Test food data lookups"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing food data ===")
+    log.debug("=== Testing food data ===")
 
     # Test apple
-    apple_food = service.get_food_points("apple")
-    apple_sat = service.get_saturation("apple")
+    apple_food = mc_service.get_food_points("apple")
+    apple_sat = mc_service.get_saturation("apple")
     assert apple_food == 4, "Apple should restore 4 food points"
     assert apple_sat == 2.4, "Apple should have 2.4 saturation"
-    print(f"✓ Apple: {apple_food} food points, {apple_sat} saturation")
+    log.debug(f"✓ Apple: {apple_food} food points, {apple_sat} saturation")
 
     # Test non-food item
-    stone_food = service.get_food_points("stone")
+    stone_food = mc_service.get_food_points("stone")
     assert stone_food == 0, "Non-food items should return 0 food points"
-    print("✓ Non-food items return 0 food points")
+    log.debug("✓ Non-food items return 0 food points")
 
 
-def test_crafting_table_requirement():
+def test_crafting_table_requirement(mc_service):
     """Test crafting table requirement checks"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing crafting table requirement ===")
+    log.debug("=== Testing crafting table requirement ===")
 
     # Items that can be crafted in inventory (2x2)
-    assert service.needs_crafting_table("stick") is False, "Stick should be craftable in inventory"
-    assert service.needs_crafting_table("oak_planks") is False, "Planks should be craftable in inventory"
-    print("✓ Stick and planks can be crafted in inventory")
+    assert mc_service.needs_crafting_table("stick") is False, "Stick should be craftable in inventory"
+    assert mc_service.needs_crafting_table("oak_planks") is False, "Planks should be craftable in inventory"
+    log.debug("✓ Stick and planks can be crafted in inventory")
 
     # Items that need crafting table (3x3)
-    assert service.needs_crafting_table("wooden_pickaxe") is True, "Pickaxe needs crafting table"
-    assert service.needs_crafting_table("chest") is True, "Chest needs crafting table"
-    print("✓ Pickaxe and chest need crafting table")
+    assert mc_service.needs_crafting_table("wooden_pickaxe") is True, "Pickaxe needs crafting table"
+    assert mc_service.needs_crafting_table("chest") is True, "Chest needs crafting table"
+    log.debug("✓ Pickaxe and chest need crafting table")
 
 
-def test_normalization():
+def test_normalization(mc_service):
     """Test item name normalization"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing normalization ===")
+    log.debug("=== Testing normalization ===")
 
     # Test plural handling
-    assert service.normalize_item_name("sticks") == "stick", "Should normalize 'sticks' to 'stick'"
-    print("✓ 'sticks' → 'stick'")
+    assert mc_service.normalize_item_name("sticks") == "stick", "Should normalize 'sticks' to 'stick'"
+    log.debug("✓ 'sticks' → 'stick'")
 
     # Test fuzzy matching
-    fuzzy_result = service.fuzzy_match_item_name("planks")
+    fuzzy_result = mc_service.fuzzy_match_item_name("planks")
     assert fuzzy_result is not None and "planks" in fuzzy_result, "Should fuzzy match 'planks' to a plank type"
-    print(f"✓ Fuzzy match 'planks' → '{fuzzy_result}'")
+    log.debug(f"✓ Fuzzy match 'planks' → '{fuzzy_result}'")
 
     # Test generic item handling
-    generic_result = service.handle_generic_item_request("planks", {})
+    generic_result = mc_service.handle_generic_item_request("planks", {})
     assert generic_result is not None and "planks" in generic_result, "Should handle generic 'planks' request"
-    print(f"✓ Generic handler 'planks' → '{generic_result}'")
+    log.debug(f"✓ Generic handler 'planks' → '{generic_result}'")
 
     # Test unchanged names
-    assert service.normalize_item_name("diamond") == "diamond", "Should not change valid names"
-    print("✓ Valid names remain unchanged")
+    assert mc_service.normalize_item_name("diamond") == "diamond", "Should not change valid names"
+    log.debug("✓ Valid names remain unchanged")
 
 
-def test_block_finding():
+def test_block_finding(mc_service):
     """Test block finding functionality"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing block finding ===")
+    log.debug("=== Testing block finding ===")
 
     # Find blocks by name pattern
-    log_blocks = service.find_blocks({"name_pattern": "log"})
+    log_blocks = mc_service.find_blocks({"name_pattern": "log"})
     assert len(log_blocks) > 0, "Should find blocks with 'log' in name"
-    print(f"✓ Found {len(log_blocks)} blocks with 'log' in name")
+    log.debug(f"✓ Found {len(log_blocks)} blocks with 'log' in name")
 
     # Find blocks by hardness
-    hard_blocks = service.find_blocks({"min_hardness": 50})
+    hard_blocks = mc_service.find_blocks({"min_hardness": 50})
     assert all(b.get("hardness", 0) >= 50 for b in hard_blocks), "All blocks should have hardness >= 50"
-    print(f"✓ Found {len(hard_blocks)} blocks with hardness >= 50")
+    log.debug(f"✓ Found {len(hard_blocks)} blocks with hardness >= 50")
 
 
-def test_id_lookups():
+def test_id_lookups(mc_service):
     """Test lookups by numeric ID"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing ID lookups ===")
+    log.debug("=== Testing ID lookups ===")
 
     # Test block by ID
-    stone_by_id = service.get_block_by_id(1)
+    stone_by_id = mc_service.get_block_by_id(1)
     assert stone_by_id is not None, "Should find stone by ID 1"
     assert stone_by_id["name"] == "stone", "Block ID 1 should be stone"
-    print("✓ Block ID 1 is stone")
+    log.debug("✓ Block ID 1 is stone")
 
     # Test item by ID
-    item_848 = service.get_item_by_id(848)
+    item_848 = mc_service.get_item_by_id(848)
     assert item_848 is not None, "Should find item by ID 848"
     assert item_848["name"] == "stick", "Item ID 848 should be stick"
-    print("✓ Item ID 848 is stick")
+    log.debug("✓ Item ID 848 is stick")
 
 
-def test_fuzzy_matching():
+def test_fuzzy_matching(mc_service):
     """Test fuzzy matching functionality"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing fuzzy matching ===")
+    log.debug("=== Testing fuzzy matching ===")
 
     # Test exact matches
-    assert service.fuzzy_match_item_name("diamond") == "diamond", "Exact match should work"
-    print("✓ Exact match: 'diamond' → 'diamond'")
+    assert mc_service.fuzzy_match_item_name("diamond") == "diamond", "Exact match should work"
+    log.debug("✓ Exact match: 'diamond' → 'diamond'")
 
     # Test substring matches
-    pickaxe_match = service.fuzzy_match_item_name("pickaxe")
+    pickaxe_match = mc_service.fuzzy_match_item_name("pickaxe")
     assert pickaxe_match is not None and "pickaxe" in pickaxe_match, "Should match items containing 'pickaxe'"
-    print(f"✓ Substring match: 'pickaxe' → '{pickaxe_match}'")
+    log.debug(f"✓ Substring match: 'pickaxe' → '{pickaxe_match}'")
 
     # Test partial word matches
-    wood_match = service.fuzzy_match_item_name("wood")
+    wood_match = mc_service.fuzzy_match_item_name("wood")
     assert wood_match is not None, "Should match items related to 'wood'"
-    print(f"✓ Partial match: 'wood' → '{wood_match}'")
+    log.debug(f"✓ Partial match: 'wood' → '{wood_match}'")
 
     # Test misspellings/close matches
-    dimond_match = service.fuzzy_match_item_name("dimond")  # Misspelled diamond
+    dimond_match = mc_service.fuzzy_match_item_name("dimond")  # Misspelled diamond
     assert dimond_match == "diamond", "Should match despite misspelling"
-    print("✓ Misspelling: 'dimond' → 'diamond'")
+    log.debug("✓ Misspelling: 'dimond' → 'diamond'")
 
 
-def test_recipe_selection():
+def test_recipe_selection(mc_service):
     """Test generic recipe selection algorithm"""
-    service = MinecraftDataService("1.21.1")
-
-    print("\n=== Testing recipe selection ===")
+    log.debug("=== Testing recipe selection ===")
 
     # Test with empty inventory
     empty_inv = {}
-    recipe = service.select_best_recipe("stick", empty_inv)
+    recipe = mc_service.select_best_recipe("stick", empty_inv)
     assert recipe is None, "Should return None with empty inventory"
-    print("✓ No recipe selected with empty inventory")
+    log.debug("✓ No recipe selected with empty inventory")
 
     # Test with materials for stick
     inv_with_planks = {"oak_planks": 2}
-    recipe = service.select_best_recipe("stick", inv_with_planks)
+    recipe = mc_service.select_best_recipe("stick", inv_with_planks)
     assert recipe is not None, "Should find recipe with oak planks"
-    materials = service.get_recipe_materials(recipe)
+    materials = mc_service.get_recipe_materials(recipe)
     assert all(inv_with_planks.get(mat, 0) >= count for mat, count in materials.items()), "Should have all materials"
-    print("✓ Selected craftable recipe with available materials")
+    log.debug("✓ Selected craftable recipe with available materials")
 
     # Test recipe preference with multiple options
     rich_inventory = {"oak_planks": 64, "birch_planks": 32, "spruce_planks": 16}
-    recipe = service.select_best_recipe("stick", rich_inventory)
+    recipe = mc_service.select_best_recipe("stick", rich_inventory)
     assert recipe is not None, "Should find recipe with rich inventory"
-    print("✓ Selected best recipe from multiple options")
-
+    log.debug("✓ Selected best recipe from multiple options")
 
-def run_all_tests():
-    """Run all tests"""
-    print("Running MinecraftDataService Tests\n")
 
-    try:
-        test_basic_lookups()
-        test_recipes()
-        test_food_data()
-        test_crafting_table_requirement()
-        test_normalization()
-        test_block_finding()
-        test_id_lookups()
-        test_fuzzy_matching()
-        test_recipe_selection()
+def test_recipe_selection_is_memoized(mc_service):
+    """Test that recipe selection is cached on the item and inventory contents"""
+    log.debug("=== Testing recipe selection cache ===")
 
-        print("\n✅ All tests passed!")
-        return True
+    cached = MinecraftDataService._select_best_recipe_cached
+    cached.cache_clear()
 
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        return False
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
+    # Test an equal inventory built in a different order hits the cache
+    recipe = mc_service.select_best_recipe("stick", {"oak_planks": 64, "birch_planks": 32})
+    assert mc_service.select_best_recipe("stick", {"birch_planks": 32, "oak_planks": 64}) is recipe
+    assert cached.cache_info().hits == 1, "Equal inventory should reuse the cached selection"
+    assert cached.cache_info().misses == 1, "First selection should be computed"
+    log.debug("✓ Repeated selection reuses the cached result")
 
-        traceback.print_exc()
-        return False
+    # Test a different inventory is scored again rather than reusing the cached result
+    assert mc_service.select_best_recipe("stick", {}) is None, "Cached result should not leak across inventories"
+    assert cached.cache_info().misses == 2, "Different inventory should be computed"
+    log.debug("✓ Different inventory is not served from the cache")
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-n", "auto"]))